@@ -1,16 +1,25 @@
+import hashlib
+import io
+import json
 import os
 import shutil
+import tarfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 class Node:
     """
     A simple binary tree node.
     """
-    def __init__(self, value, left=None, right=None):
+    def __init__(self, value: int, left: Optional["Node"] = None,
+                 right: Optional["Node"] = None) -> None:
         self.value = value
         self.left = left
         self.right = right
 
-def build_example_tree():
+def build_example_tree() -> Node:
     """
     Build and return a sample unbalanced binary tree with:
     - One duplicate value (5 appears twice)
@@ -24,143 +33,598 @@ def build_example_tree():
                        \
                        22
     """
-    root = Node(10)
-    root.left = Node(9)
-    root.right = Node(15)
+    # Built in one nested expression: Node(value, left, right)
+    return Node(10,
+                Node(9, Node(5), Node(2)),
+                Node(15, Node(-3), Node(5, None, Node(22))))
 
-    root.left.left = Node(5)
-    root.left.right = Node(2)
 
-    root.right.left = Node(-3)
-    root.right.right = Node(5)
-    root.right.right.right = Node(22)
+# Deepest level whose stylesheet path is prebuilt; deeper pages build theirs on demand
+MAX_EXPECTED_DEPTH = 64
 
-    return root
+# Relative stylesheet path for each depth, built once at import time
+_CSS_PATHS: tuple[str, ...] = tuple("../" * depth + "styles.css"
+                                    for depth in range(MAX_EXPECTED_DEPTH))
 
-
-def get_css_path(depth):
+def get_css_path(depth: int) -> str:
     """
     Return a relative path to the 'styles.css' file based on the node's depth.
     - The root is at depth 0 (where 'index.html' and 'styles.css' live side by side).
     - A child is depth 1, so it references "../styles.css".
     - A grandchild is depth 2, so it references "../../styles.css", etc.
     """
+    if depth < MAX_EXPECTED_DEPTH:
+        return _CSS_PATHS[depth]
     return "../" * depth + "styles.css"
 
-def generate_node_page(node, parent_path, output_dir, depth):
+# Pages are assembled as UTF-8 bytes from static fragments instead of
+# formatting a whole template per page, so nothing is encoded at write time.
+# The only part that depends on depth (through the stylesheet path) sits
+# between the title and the heading, so that piece is built once per depth
+# at import time.
+_PAGE_HEAD = b"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8" />
+    <title>"""
+
+_NAV_START = b"""</h1>
+    <nav>
+        """
+
+_PAGE_TAIL = b"""
+    </nav>
+</body>
+</html>
+"""
+
+_LEFT_LINK = b'<a class="circle-link" href="left/index.html">Left</a>'
+_RIGHT_LINK = b'<a class="circle-link" href="right/index.html">Right</a>'
+_PARENT_LINK_START = b'<a class="circle-link" href="'
+_PARENT_LINK_END = b'">Return to Parent</a>'
+
+def _build_page_middle(css_rel_path: str) -> bytes:
+    """
+    Build the HTML (as bytes) between a page's title and its heading text.
+    """
+    return f"""</title>
+    <link rel="stylesheet" href="{css_rel_path}">
+</head>
+<body>
+    <h1 class="node-value">""".encode("utf-8")
+
+_PAGE_MIDDLES: tuple[bytes, ...] = tuple(_build_page_middle(css_rel_path)
+                                         for css_rel_path in _CSS_PATHS)
+
+def get_page_middle(depth: int) -> bytes:
+    """
+    Return the HTML bytes between a page's title and its heading text for a page
+    at the given depth, from the prebuilt table when possible.
+    """
+    if depth < MAX_EXPECTED_DEPTH:
+        return _PAGE_MIDDLES[depth]
+    return _build_page_middle(get_css_path(depth))
+
+def generate_node_page(node: Node, parent_path: Optional[str], output_dir: str,
+                       depth: int) -> tuple[str, bytes]:
     """
     Generate the HTML for a single node's 'index.html' file.
+    Nothing is written here; the page is returned so it can be written later.
     
     :param node: Current Node
     :param parent_path: The relative link to the parent's index.html (e.g., "../index.html")
     :param output_dir: Folder path to place this node's 'index.html'
     :param depth: How many levels deep this node is from the root
+    :return: A (file path, HTML bytes) pair for this node's 'index.html'
     """
-    css_rel_path = get_css_path(depth)
+    value = str(node.value).encode("utf-8")
 
-    # Determine child links (either to actual child or null page)
-    left_link_html = f'<a class="circle-link" href="left/index.html">Left</a>'
-    right_link_html = f'<a class="circle-link" href="right/index.html">Right</a>'
+    # Child links always exist (either to the actual child or its null page);
+    # only the root has no parent link
+    parent_link_html = (_PARENT_LINK_START + parent_path.encode("utf-8") + _PARENT_LINK_END
+                        if parent_path else b'')
 
-    parent_link_html = (f'<a class="circle-link" href="{parent_path}">Return to Parent</a>'
-                        if parent_path else '')
+    html_content = b"".join([
+        _PAGE_HEAD, b"Node ", value, get_page_middle(depth), value, _NAV_START,
+        _LEFT_LINK, b"\n        ", parent_link_html, b"\n        ", _RIGHT_LINK,
+        _PAGE_TAIL,
+    ])
 
-    # Build the HTML content
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8" />
-    <title>Node {node.value}</title>
-    <link rel="stylesheet" href="{css_rel_path}">
-</head>
-<body>
-    <h1 class="node-value">{node.value}</h1>
-    <nav>
-        {left_link_html}
-        {parent_link_html}
-        {right_link_html}
-    </nav>
-</body>
-</html>
-"""
+    return f"{output_dir}/index.html", html_content
 
-    # Write out the HTML to index.html
-    with open(os.path.join(output_dir, "index.html"), "w", encoding="utf-8") as f:
-        f.write(html_content)
 
-
-def generate_null_page(output_dir, parent_path):
+def generate_null_page(output_dir: str, parent_path: Optional[str],
+                       depth: int) -> tuple[str, bytes]:
     """
     Generate an 'index.html' page for a null node.
+    Nothing is written here; the page is returned so it can be written later.
     
     :param output_dir: The folder where this node's page is stored
-    :param parent_path: Relative path to this node's parent index.html
+    :param parent_path: Relative path to this node's parent index.html (None for an empty tree)
+    :param depth: How many levels deep this null node is from the root
+    :return: A (file path, HTML bytes) pair for this node's 'index.html'
     """
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8" />
-    <title>Null</title>
-    <link rel="stylesheet" href="{get_css_path(output_dir.count(os.sep))}">
-</head>
-<body>
-    <h1 class="node-value">null</h1>
-    <nav>
-        <a class="circle-link" href="{parent_path}">Return to Parent</a>
-    </nav>
-</body>
-</html>
-"""
+    parent_link_html = (_PARENT_LINK_START + parent_path.encode("utf-8") + _PARENT_LINK_END
+                        if parent_path else b'')
+
+    html_content = b"".join([
+        _PAGE_HEAD, b"Null", get_page_middle(depth), b"null", _NAV_START,
+        parent_link_html,
+        _PAGE_TAIL,
+    ])
+
+    return f"{output_dir}/index.html", html_content
+
+# Flags for creating or truncating an output file; O_BINARY only exists
+# (and is only needed to stop newline translation) on Windows.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+def write_file(path: str, data: bytes) -> None:
+    """
+    Write bytes to a file with raw os-level calls, skipping the buffering
+    and codec layers that open() would set up.
+
+    :param path: The file to create or overwrite
+    :param data: The already-encoded bytes to write
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        # os.write may write fewer bytes than asked, so keep going until done
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+def write_page(page: tuple[str, bytes]) -> None:
+    """
+    Write a single generated page to disk. Its folder must already exist.
+
+    :param page: A (file path, HTML bytes) pair as returned by generate_node_page
+    """
+    path, html_content = page
+    write_file(path, html_content)
+
+def remove_path(path: str) -> None:
+    """
+    Remove whatever is at path (a symlink, a file, or a whole folder) so a
+    link can be made in its place. Does nothing if the path does not exist.
+
+    :param path: The path to clear
+    """
+    if os.path.islink(path) or os.path.isfile(path):
+        os.remove(path)
+    elif os.path.isdir(path):
+        shutil.rmtree(path)
+
+def link_null_pages(output_dir: str, null_dirs_by_depth: dict[int, list[str]]) -> list[str]:
+    """
+    Write one shared null page per depth and point every null folder of
+    that depth at it, instead of writing a separate copy into each one.
+
+    Null pages only differ by depth (through their stylesheet path), so the
+    shared copy for depth d lives in output_dir/_null_d<d>. Each null folder
+    becomes a symlink to that folder; where symlinks are not available
+    (e.g. Windows without the needed privilege), each null folder instead
+    gets a hard link to the shared index.html.
+
+    Either way, a page later written into one of these folders would land
+    in the shared page (and so in every null page of that depth), so they
+    must be removed before anything else is written there. An incremental
+    run of generate_tree_pages does that using the paths returned here.
+
+    :param output_dir: The root folder of the site
+    :param null_dirs_by_depth: Dict mapping a depth to the null folders at that depth
+    :return: Every shared folder and linked null folder that was created
+    """
+    use_symlinks = True
+    link_paths: list[str] = []
+
+    for depth, null_dirs in null_dirs_by_depth.items():
+        shared_dir = f"{output_dir}/_null_d{depth}"
+        os.makedirs(shared_dir, exist_ok=True)
+        shared_path, html_content = generate_null_page(shared_dir, "../index.html", depth)
+        write_file(shared_path, html_content)
+        link_paths.append(shared_dir)
+
+        for null_dir in null_dirs:
+            link_paths.append(null_dir)
+            # An incremental run may have left a page folder here
+            remove_path(null_dir)
+            if use_symlinks:
+                try:
+                    os.symlink(os.path.relpath(shared_dir, os.path.dirname(null_dir)),
+                               null_dir, target_is_directory=True)
+                    continue
+                except (OSError, NotImplementedError):
+                    use_symlinks = False
+
+            os.makedirs(null_dir, exist_ok=True)
+            os.link(shared_path, f"{null_dir}/index.html")
+
+    return link_paths
+
+def get_subtree_ids(root: Node) -> dict[int, int]:
+    """
+    Number every subtree so that two nodes get the same number exactly when
+    their subtrees would render the same pages (same values, same shape).
+
+    Each node is keyed by its rendered value and its children's numbers, so
+    every key is small and the whole pass is linear in the size of the tree.
+
+    :param root: The root Node of the tree
+    :return: Dict mapping id(node) to that node's subtree number
+    """
+    subtree_ids: dict[int, int] = {}
+    numbers: dict[tuple[str, Optional[int], Optional[int]], int] = {}
+
+    # Post-order walk: each node is visited again once its children are numbered
+    stack: list[tuple[Node, bool]] = [(root, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if not children_done:
+            stack.append((node, True))
+            if node.right:
+                stack.append((node.right, False))
+            if node.left:
+                stack.append((node.left, False))
+            continue
+
+        key = (str(node.value),
+               subtree_ids[id(node.left)] if node.left else None,
+               subtree_ids[id(node.right)] if node.right else None)
+        subtree_ids[id(node)] = numbers.setdefault(key, len(numbers))
+
+    return subtree_ids
+
+def link_subtrees(linked_dirs: list[tuple[str, str]]) -> None:
+    """
+    Point each duplicate subtree folder at the already generated copy of
+    that subtree, using a relative symlink. Where symlinks are not
+    available, the generated folder is copied instead.
 
-    # Write out the HTML to index.html
-    with open(os.path.join(output_dir, "index.html"), "w", encoding="utf-8") as f:
-        f.write(html_content)
+    A page later written into one of the symlinked folders would land in
+    the generated copy, so they must be removed before anything else is
+    written there. An incremental run of generate_tree_pages does that
+    using its manifest.
 
-def generate_tree_pages(node, output_dir, parent_path=None, depth=0):
+    :param linked_dirs: List of (duplicate folder, generated folder) pairs
     """
-    Recursively create directories for the node, generate its index.html,
-    and do the same for the left and right children. Generates 'null' pages
-    where children are missing.
+    use_symlinks = True
+
+    for link_dir, target_dir in linked_dirs:
+        # An incremental run may have left a page folder here
+        remove_path(link_dir)
+        if use_symlinks:
+            try:
+                os.symlink(os.path.relpath(target_dir, os.path.dirname(link_dir)),
+                           link_dir, target_is_directory=True)
+                continue
+            except (OSError, NotImplementedError):
+                use_symlinks = False
+
+        shutil.copytree(target_dir, link_dir)
+
+# Name of the file, kept at the site root, that records the pages and links
+# made by the last incremental run. The leading dot keeps it out of the way
+# of the pages, which are all named index.html.
+MANIFEST_NAME = ".manifest.json"
+
+def get_site_path(output_dir: str, rel_path: str) -> Optional[str]:
+    """
+    Return the path of a manifest entry inside output_dir, or None if the
+    entry is absolute or leads outside output_dir (through ".." or a
+    symlinked folder). Only paths returned here are ever removed, so a
+    damaged or hand-edited manifest cannot delete anything outside the site.
+
+    :param output_dir: The root folder of the site
+    :param rel_path: A page or link path, relative to output_dir
+    :return: The absolute path, or None if the entry is rejected
+    """
+    if os.path.isabs(rel_path) or os.path.splitdrive(rel_path)[0]:
+        return None
+
+    path = os.path.abspath(os.path.join(output_dir, rel_path))
+    # The entry itself may be a symlink that is about to be removed, so
+    # only its folder is resolved
+    site_dir = os.path.realpath(output_dir)
+    parent_dir = os.path.realpath(os.path.dirname(path))
+    if os.path.commonpath([site_dir, parent_dir]) != site_dir:
+        return None
+    return path
+
+def load_manifest(output_dir: str) -> Optional[tuple[dict[str, str], list[str]]]:
+    """
+    Load the manifest saved by the previous incremental run.
+
+    :param output_dir: The root folder of the site
+    :return: A (page hashes, link paths) pair, both relative to output_dir, or
+             None if there is no readable manifest
+    """
+    try:
+        with open(f"{output_dir}/{MANIFEST_NAME}", encoding="utf-8") as f:
+            manifest = json.load(f)
+        page_hashes, link_paths = manifest["pages"], manifest["links"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if not (isinstance(page_hashes, dict) and isinstance(link_paths, list)
+            and all(isinstance(entry, str)
+                    for entry in [*page_hashes, *page_hashes.values(), *link_paths])):
+        return None
+    return page_hashes, link_paths
+
+def scan_site(output_dir: str) -> tuple[dict[str, str], list[str]]:
+    """
+    Find the pages and links of a site that has no manifest (e.g. one
+    written by a run that was not incremental) by looking at the files
+    themselves. Their hashes are unknown, so every page found is given an
+    empty hash and is rewritten if it is still generated.
+
+    :param output_dir: The root folder of the site
+    :return: A (page hashes, link paths) pair, as returned by load_manifest
+    """
+    page_hashes: dict[str, str] = {}
+    link_paths: list[str] = []
+
+    # Symlinked folders are listed but, by default, not walked into
+    for dir_path, dir_names, file_names in os.walk(output_dir):
+        rel_dir = os.path.relpath(dir_path, output_dir).replace(os.sep, "/")
+        prefix = "" if rel_dir == "." else f"{rel_dir}/"
+
+        for name in dir_names + file_names:
+            path = os.path.join(dir_path, name)
+            if os.path.islink(path):
+                link_paths.append(prefix + name)
+            elif name == "index.html":
+                if os.stat(path).st_nlink > 1:
+                    # A null folder hard-linked to a shared page
+                    link_paths.append(rel_dir)
+                else:
+                    page_hashes[prefix + name] = ""
+
+    return page_hashes, link_paths
+
+def save_manifest(output_dir: str, page_hashes: dict[str, str], link_paths: list[str]) -> None:
+    """
+    Save the pages and links of this run at the site root for the next
+    incremental run.
+
+    :param output_dir: The root folder of the site
+    :param page_hashes: Dict mapping each page's relative path to its SHA-1
+    :param link_paths: Relative paths of every folder that is (or holds) a link
+    """
+    manifest = {"pages": page_hashes, "links": sorted(link_paths)}
+    write_file(f"{output_dir}/{MANIFEST_NAME}",
+               json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"))
+
+def hash_pages(output_dir: str, pages: list[tuple[str, bytes]]) -> dict[str, str]:
+    """
+    Hash every generated page for the manifest.
+
+    :param output_dir: The root folder of the site
+    :param pages: Every (path, HTML bytes) pair generated for the site
+    :return: Dict mapping each page's path, relative to output_dir, to the
+             SHA-1 of its content
+    """
+    # Every page path starts with output_dir followed by "/"
+    prefix_len = len(output_dir) + 1
+    return {path[prefix_len:]: hashlib.sha1(html_content).hexdigest()
+            for path, html_content in pages}
+
+def get_changed_pages(output_dir: str, pages: list[tuple[str, bytes]],
+                      page_hashes: dict[str, str], old_page_hashes: dict[str, str]
+                      ) -> list[tuple[str, bytes]]:
+    """
+    Compare freshly generated pages against the hashes saved by the previous
+    run, and return only those whose content changed (or whose file is gone).
+    Pages the previous run wrote that were not generated this time are
+    deleted, along with any folders that leaves empty.
+
+    :param output_dir: The root folder of the site
+    :param pages: Every (path, HTML bytes) pair generated for the site
+    :param page_hashes: The hashes of those pages, as returned by hash_pages
+    :param old_page_hashes: The page hashes from the previous run
+    :return: The pages that need to be written
+    """
+    # Every page path starts with output_dir followed by "/"
+    prefix_len = len(output_dir) + 1
+
+    changed_pages: list[tuple[str, bytes]] = []
+    for page in pages:
+        path = page[0]
+        rel_path = path[prefix_len:]
+        if old_page_hashes.get(rel_path) != page_hashes[rel_path] or not os.path.exists(path):
+            changed_pages.append(page)
+
+    # Remove stale pages deepest first, so emptied folders can go too
+    stale_paths = sorted(old_page_hashes.keys() - page_hashes.keys(), key=len, reverse=True)
+    for rel_path in stale_paths:
+        stale_path = get_site_path(output_dir, rel_path)
+        if stale_path is None:
+            continue
+        try:
+            os.remove(stale_path)
+            os.rmdir(os.path.dirname(stale_path))
+        except OSError:
+            # Already gone, or the folder still holds other pages
+            pass
+
+    return changed_pages
+
+def walk_tree(node: Node, output_dir: str, parent_path: Optional[str] = None, depth: int = 0,
+              share_subtrees: bool = False
+              ) -> tuple[list[tuple[str, bytes]], dict[int, list[str]], list[tuple[str, str]]]:
+    """
+    Walk the tree (which must not be empty) and generate every node's page
+    in memory, without touching the file system.
+
+    The walk uses an explicit stack rather than recursion, so deep trees
+    cannot exhaust the call stack. Null children are only recorded; their
+    pages are left to the caller, which decides whether to share them.
+
+    :param node: The root Node of the (sub)tree
+    :param output_dir: The folder where this node's page is stored
+    :param parent_path: Relative path to this node's parent's index.html
+    :param depth: Depth of this node from the root (root=0, child=1, grandchild=2, etc.)
+    :param share_subtrees: If True, a subtree identical to one already walked at
+                           the same depth is recorded as a link rather than walked again
+    :return: A (pages, null_dirs_by_depth, linked_dirs) tuple: the (path, HTML bytes)
+             pairs for every node, the null folders grouped by depth, and the
+             (duplicate folder, generated folder) pairs for shared subtrees
+    """
+    pages: list[tuple[str, bytes]] = []
+    # Null folders, grouped by depth
+    null_dirs_by_depth: dict[int, list[str]] = {}
+
+    # Each entry is (node, output_dir, parent_path, depth) for a real node;
+    # null children are recorded directly instead of being queued
+    stack: deque[tuple[Node, str, Optional[str], int]] = deque(
+        [(node, output_dir, parent_path, depth)])
+
+    # Pages depend on depth through the stylesheet path, so subtrees are only
+    # shared with an identical subtree at the same depth
+    subtree_ids = get_subtree_ids(node) if share_subtrees else {}
+    generated_dirs: dict[tuple[int, int], str] = {}  # (subtree number, depth) -> folder
+    linked_dirs: list[tuple[str, str]] = []          # (duplicate folder, generated folder)
+
+    while stack:
+        node, output_dir, parent_path, depth = stack.pop()
+
+        if share_subtrees:
+            key = (subtree_ids[id(node)], depth)
+            if key in generated_dirs:
+                linked_dirs.append((output_dir, generated_dirs[key]))
+                continue
+            generated_dirs[key] = output_dir
+
+        # Generate this node's HTML page
+        pages.append(generate_node_page(node, parent_path, output_dir, depth))
+
+        # Paths are joined with a plain "/", which Windows accepts as well.
+        # The right subtree is queued first so the left one is generated first.
+
+        # Right subtree (or null page)
+        right_child_path = f"{output_dir}/right"
+        if node.right:
+            stack.append((node.right, right_child_path, "../index.html", depth+1))
+        else:
+            null_dirs_by_depth.setdefault(depth+1, []).append(right_child_path)
+
+        # Left subtree (or null page)
+        left_child_path = f"{output_dir}/left"
+        if node.left:
+            stack.append((node.left, left_child_path, "../index.html", depth+1))
+        else:
+            null_dirs_by_depth.setdefault(depth+1, []).append(left_child_path)
+
+    return pages, null_dirs_by_depth, linked_dirs
+
+def generate_tree_pages(node: Optional[Node], output_dir: str, parent_path: Optional[str] = None,
+                        depth: int = 0, share_null_pages: bool = False,
+                        share_subtrees: bool = False, incremental: bool = False) -> None:
+    """
+    Generate an index.html for every node in the tree, plus 'null' pages
+    where children are missing, and write them all into nested left/right
+    folders under output_dir.
+
+    Every page is first built in memory by walk_tree. All folders are then
+    created in one pass, and the pages are written by a thread pool, since
+    the work is almost entirely file system calls that release the GIL.
+
+    Unless incremental is set, output_dir must not already hold pages from
+    an earlier run, since pages are written straight into the folders found
+    there. An incremental run instead records the
+    pages it wrote and the links it made in a manifest at the root of
+    output_dir. The next incremental run removes those links before writing
+    anything, so no page is written through a link into a shared copy, and
+    deletes the pages that are no longer generated. Without a manifest, the
+    same is found by scanning output_dir (see scan_site).
     
-    :param node: The current Node (or None for null nodes)
+    :param node: The root Node of the (sub)tree (or None for a null node)
     :param output_dir: The folder where this node's page is stored
     :param parent_path: Relative path to this node's parent's index.html
     :param depth: Depth of this node from the root (root=0, child=1, grandchild=2, etc.)
+    :param share_null_pages: If True, link null folders to one shared page per
+                             depth (see link_null_pages) instead of writing a copy
+                             into each
+    :param share_subtrees: If True, a subtree identical to one already generated at
+                           the same depth is linked to it (see link_subtrees) rather
+                           than generated again. This leaves symlinks in output_dir,
+                           which must not be written through by a later run
+    :param incremental: If True, only write pages whose content changed since the
+                        last incremental run and delete pages that no longer exist
+                        (see get_changed_pages)
     """
+    if incremental:
+        old_manifest = load_manifest(output_dir)
+        if old_manifest is None:
+            old_manifest = scan_site(output_dir)
+        else:
+            # Drop the manifest until this run finishes, so an interrupted
+            # run leaves no stale record behind
+            os.remove(f"{output_dir}/{MANIFEST_NAME}")
+        old_page_hashes, old_link_paths = old_manifest
+
+        # Break the previous run's links, so nothing below writes through them
+        for link_path in old_link_paths:
+            path = get_site_path(output_dir, link_path)
+            if path is not None:
+                remove_path(path)
+
     if node is None:
         # If the node is null, just make a placeholder page with a "Return to Parent" link
         os.makedirs(output_dir, exist_ok=True)
-        generate_null_page(output_dir, parent_path)
-        return
+        pages = [generate_null_page(output_dir, parent_path, depth)]
+        null_dirs_by_depth: dict[int, list[str]] = {}
+        linked_dirs: list[tuple[str, str]] = []
+    else:
+        pages, null_dirs_by_depth, linked_dirs = walk_tree(node, output_dir, parent_path, depth,
+                                                           share_subtrees)
+
+    # Every null folder is a leaf, and every node folder is an ancestor of
+    # some null folder, so creating these creates them all
+    if share_null_pages:
+        # The null folders themselves become links, so only create their parents
+        leaf_dirs = {os.path.dirname(null_dir)
+                     for null_dirs in null_dirs_by_depth.values() for null_dir in null_dirs}
+    else:
+        leaf_dirs = {null_dir for null_dirs in null_dirs_by_depth.values() for null_dir in null_dirs}
+        for null_depth, null_dirs in null_dirs_by_depth.items():
+            for null_dir in null_dirs:
+                pages.append(generate_null_page(null_dir, "../index.html", null_depth))
 
-    # Ensure the output directory exists
-    os.makedirs(output_dir, exist_ok=True)
+    if incremental:
+        page_hashes = hash_pages(output_dir, pages)
+        pages = get_changed_pages(output_dir, pages, page_hashes, old_page_hashes)
 
-    # Generate this node's HTML page
-    generate_node_page(node, parent_path, output_dir, depth)
+    # Linked subtree folders are not generated, so their parents may
+    # have no null folder below them
+    leaf_dirs.update(os.path.dirname(link_dir) for link_dir, _ in linked_dirs)
 
-    # Generate left subtree (or null page)
-    left_child_path = os.path.join(output_dir, "left")
-    left_parent_link = "../index.html"
-    if node.left:
-        generate_tree_pages(node.left, left_child_path, left_parent_link, depth+1)
-    else:
-        generate_tree_pages(None, left_child_path, left_parent_link, depth+1)
+    # Create all folders up front so the writers never need to
+    for leaf_dir in leaf_dirs:
+        os.makedirs(leaf_dir, exist_ok=True)
 
-    # Generate right subtree (or null page)
-    right_child_path = os.path.join(output_dir, "right")
-    right_parent_link = "../index.html"
-    if node.right:
-        generate_tree_pages(node.right, right_child_path, right_parent_link, depth+1)
-    else:
-        generate_tree_pages(None, right_child_path, right_parent_link, depth+1)
+    # Write every page; list() surfaces any exception raised by a worker
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4) as executor:
+        list(executor.map(write_page, pages))
 
+    link_paths = []
+    if share_null_pages:
+        link_paths.extend(link_null_pages(output_dir, null_dirs_by_depth))
 
-def create_css_file(output_folder):
-    """
-    Creates a single 'styles.css' file at the root output folder.
-    """
-    css_content = """
+    if share_subtrees:
+        link_subtrees(linked_dirs)
+        link_paths.extend(link_dir for link_dir, _ in linked_dirs)
+
+    # Saved last, once every page and link is in place
+    if incremental:
+        prefix_len = len(output_dir) + 1
+        save_manifest(output_dir, page_hashes, [path[prefix_len:] for path in link_paths])
+
+
+# Stylesheet shared by every page, built (and encoded) once at import time
+_CSS_CONTENT = b"""
 /* Simple styling with a cream background and some circle links */
 body {
   font-family: Arial, sans-serif;
@@ -200,16 +664,139 @@ nav {
   color: #fff;
 }
 """
-    with open(os.path.join(output_folder, "styles.css"), "w", encoding="utf-8") as f:
-        f.write(css_content)
 
-def main():
+def create_css_file(output_folder: str) -> None:
+    """
+    Creates a single 'styles.css' file at the root output folder.
+    """
+    write_file(os.path.join(output_folder, "styles.css"), _CSS_CONTENT)
+
+def generate_site_archive(node: Node, archive_path: str, site_folder: str = "tree_site") -> None:
+    """
+    Write the whole site (every page plus 'styles.css') into a single tar
+    archive instead of thousands of small files, e.g. for deploying the site
+    as one artifact. Members are stored under site_folder/, so extracting
+    the archive recreates the same layout generate_tree_pages would write.
+
+    :param node: The root Node of the tree
+    :param archive_path: Path of the .tar file to create
+    :param site_folder: Folder name the pages are stored under inside the archive
+    """
+    pages, null_dirs_by_depth, _ = walk_tree(node, site_folder)
+    for null_depth, null_dirs in null_dirs_by_depth.items():
+        for null_dir in null_dirs:
+            pages.append(generate_null_page(null_dir, "../index.html", null_depth))
+    pages.append((f"{site_folder}/styles.css", _CSS_CONTENT))
+
+    mtime = time.time()
+    with tarfile.open(archive_path, "w") as tf:
+        for path, data in pages:
+            info = tarfile.TarInfo(name=path)
+            info.size = len(data)
+            info.mtime = mtime
+            tf.addfile(info, io.BytesIO(data))
+
+# Shell of the single-file site. Only the section named by the URL fragment
+# is shown. The root section ("#node") is shown by default and is written
+# last, so the "~" rule can hide it whenever any other section is targeted.
+_SINGLE_PAGE_HEAD = b"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8" />
+    <title>Tree</title>
+    <style>""" + _CSS_CONTENT + b"""
+section {
+  display: none;
+}
+
+section:target,
+#node {
+  display: block;
+}
+
+section:target ~ #node {
+  display: none;
+}
+    </style>
+</head>
+<body>
+"""
+
+_SINGLE_PAGE_TAIL = b"""</body>
+</html>
+"""
+
+def _build_section(section_id: bytes, value: bytes, nav_links: list[bytes]) -> bytes:
+    """
+    Build the HTML (as bytes) for one node's section of the single-file site.
+    """
+    return b"""<section id="%b">
+    <h1 class="node-value">%b</h1>
+    <nav>
+        %b
+    </nav>
+</section>
+""" % (section_id, value, b"\n        ".join(nav_links))
+
+def generate_single_page_site(node: Node, output_path: str) -> None:
+    """
+    Write the whole tree as one HTML file with a <section> per node (and per
+    null child) instead of one file per node. Sections are linked by URL
+    fragments (e.g. "#node-left-right"), and each section is streamed through
+    a single large write buffer as soon as it is built.
+
+    :param node: The root Node of the tree
+    :param output_path: Path of the HTML file to create
+    """
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        f.write(_SINGLE_PAGE_HEAD)
+
+        # Each entry is (node, section id, parent section id); ids record the
+        # path from the root, since node values are not unique
+        stack: deque[tuple[Node, bytes, bytes]] = deque()
+        if node.right:
+            stack.append((node.right, b"node-right", b"node"))
+        if node.left:
+            stack.append((node.left, b"node-left", b"node"))
+
+        while stack:
+            child, section_id, parent_id = stack.pop()
+            f.write(_build_section(section_id, str(child.value).encode("utf-8"), [
+                b'<a class="circle-link" href="#%b-left">Left</a>' % section_id,
+                b'<a class="circle-link" href="#%b">Return to Parent</a>' % parent_id,
+                b'<a class="circle-link" href="#%b-right">Right</a>' % section_id,
+            ]))
+
+            # The right subtree is queued first so the left one is written first.
+            # Null children are written straight away rather than queued.
+            for grandchild, side in ((child.right, b"-right"), (child.left, b"-left")):
+                if grandchild:
+                    stack.append((grandchild, section_id + side, section_id))
+                else:
+                    f.write(_build_section(section_id + side, b"null", [
+                        b'<a class="circle-link" href="#%b">Return to Parent</a>' % section_id,
+                    ]))
+
+        # Null children of the root, then the root itself, which must come last
+        for side, root_child in ((b"-left", node.left), (b"-right", node.right)):
+            if not root_child:
+                f.write(_build_section(b"node" + side, b"null", [
+                    b'<a class="circle-link" href="#node">Return to Parent</a>',
+                ]))
+        f.write(_build_section(b"node", str(node.value).encode("utf-8"), [
+            b'<a class="circle-link" href="#node-left">Left</a>',
+            b'<a class="circle-link" href="#node-right">Right</a>',
+        ]))
+
+        f.write(_SINGLE_PAGE_TAIL)
+
+def main() -> None:
     """
     Main entry point:
     - Build the tree
-    - Wipe/create an output folder
-    - Generate all pages
+    - Create the output folder if needed
     - Write a single CSS file in the root
+    - Generate all pages, overwriting the previous site in place
     """
     # Build the sample tree
     root = build_example_tree()
@@ -217,11 +804,9 @@ def main():
     # Define the output folder
     output_folder = "tree_site"
 
-    # Remove old site folder if it exists
-    if os.path.exists(output_folder):
-        shutil.rmtree(output_folder)
-
-    # Create the main output folder again
+    # A previous site is not wiped: an incremental run rewrites only the
+    # pages that changed and prunes the ones that no longer exist, using the
+    # manifest kept in the site (or a scan of it, if there is none)
     os.makedirs(output_folder, exist_ok=True)
 
     # Create the CSS file in the root
@@ -229,7 +814,7 @@ def main():
 
     # Generate the pages for the entire tree
     # The root node has no parent, so parent_path=None, depth=0
-    generate_tree_pages(root, output_folder, parent_path=None, depth=0)
+    generate_tree_pages(root, output_folder, parent_path=None, depth=0, incremental=True)
 
     print(f"Website generated in folder: {output_folder}")
     print("Open 'index.html' inside that folder in your browser to explore the tree!")